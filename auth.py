@@ -1,48 +1,121 @@
 """Authentication utilities for Agent Hub."""
 
+import asyncio
 import secrets
+import time
+from dataclasses import dataclass
 from typing import Optional
 import bcrypt
+from argon2 import PasswordHasher, Type, extract_parameters
+from argon2.exceptions import InvalidHashError, VerificationError
+from argon2.low_level import ARGON2_VERSION
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from config import ARGON2_MEMORY_COST, ARGON2_TIME_COST
+from database import async_session, redis_client
 from models import User
 
-# Simple session store (in production, use Redis or database sessions)
+# In-process session store, used when REDIS_URL is not configured
 sessions: dict[str, int] = {}
+SESSION_TTL = 86400 * 7  # 7 days, same as the session cookie
+SESSION_KEY_PREFIX = "sess:"
+
+# Short-lived cache of session users so authenticated requests skip a DB query
+USER_CACHE_TTL = 30.0
+USER_CACHE_MAXSIZE = 1024
+
+
+@dataclass(frozen=True)
+class CachedUser:
+    """Detached snapshot of the user fields needed per request."""
+
+    id: int
+    username: str
+    api_config: Optional[dict]
+
+
+_user_cache: dict[int, tuple[float, CachedUser]] = {}
 
 SECRET_KEY = secrets.token_hex(32)
 SESSION_COOKIE_NAME = "session_id"
 
+# Argon2id; the defaults match the RFC 9106 low-memory profile
+password_hasher = PasswordHasher(time_cost=ARGON2_TIME_COST, memory_cost=ARGON2_MEMORY_COST)
+
+
+def is_bcrypt_hash(password_hash: str) -> bool:
+    """Check whether a stored hash is a legacy bcrypt hash."""
+    return password_hash.startswith(("$2a$", "$2b$", "$2y$"))
+
+
+def needs_rehash(password_hash: str) -> bool:
+    """Check whether a stored hash is older or weaker than the current policy."""
+    if is_bcrypt_hash(password_hash):
+        return True
+    # Only upgrade: a lowered cost (e.g. in dev) must not weaken existing hashes
+    params = extract_parameters(password_hash)
+    return (
+        params.type is not Type.ID
+        or params.version < ARGON2_VERSION
+        or params.time_cost < ARGON2_TIME_COST
+        or params.memory_cost < ARGON2_MEMORY_COST
+    )
+
 
-def hash_password(password: str) -> str:
-    """Hash a password using bcrypt."""
-    salt = bcrypt.gensalt()
-    return bcrypt.hashpw(password.encode(), salt).decode()
+def _hash_password(password: str) -> str:
+    """Hash a password synchronously (CPU-bound)."""
+    return password_hasher.hash(password)
 
 
-def verify_password(password: str, password_hash: str) -> bool:
-    """Verify a password against its hash."""
-    return bcrypt.checkpw(password.encode(), password_hash.encode())
+def _verify_password(password: str, password_hash: str) -> bool:
+    """Verify a password synchronously (CPU-bound)."""
+    if is_bcrypt_hash(password_hash):
+        return bcrypt.checkpw(password.encode(), password_hash.encode())
+    try:
+        return password_hasher.verify(password_hash, password)
+    except (VerificationError, InvalidHashError):
+        return False
 
 
-def create_session(user_id: int) -> str:
+# Hashing releases the GIL, so run it on the default executor instead of
+# blocking the event loop for the duration of a hash.
+async def hash_password(password: str) -> str:
+    """Hash a password using Argon2id."""
+    return await asyncio.to_thread(_hash_password, password)
+
+
+async def verify_password(password: str, password_hash: str) -> bool:
+    """Verify a password against its hash (Argon2id or legacy bcrypt)."""
+    return await asyncio.to_thread(_verify_password, password, password_hash)
+
+
+async def create_session(user_id: int) -> str:
     """Create a new session for a user."""
-    session_id = secrets.token_urlsafe(32)
-    sessions[session_id] = user_id
+    session_id = secrets.token_urlsafe(16)  # 128 bits
+    if redis_client is not None:
+        await redis_client.setex(f"{SESSION_KEY_PREFIX}{session_id}", SESSION_TTL, user_id)
+    else:
+        sessions[session_id] = user_id
     return session_id
 
 
-def get_user_id_from_session(session_id: Optional[str]) -> Optional[int]:
+async def get_user_id_from_session(session_id: Optional[str]) -> Optional[int]:
     """Get user ID from session ID."""
     if not session_id:
         return None
+    if redis_client is not None:
+        user_id = await redis_client.get(f"{SESSION_KEY_PREFIX}{session_id}")
+        return int(user_id) if user_id else None
     return sessions.get(session_id)
 
 
-def delete_session(session_id: str) -> None:
+async def delete_session(session_id: str) -> None:
     """Delete a session."""
-    sessions.pop(session_id, None)
+    if redis_client is not None:
+        await redis_client.delete(f"{SESSION_KEY_PREFIX}{session_id}")
+    else:
+        sessions.pop(session_id, None)
 
 
 async def get_user_by_username(db: AsyncSession, username: str) -> Optional[User]:
@@ -53,13 +126,44 @@ async def get_user_by_username(db: AsyncSession, username: str) -> Optional[User
 
 async def get_user_by_id(db: AsyncSession, user_id: int) -> Optional[User]:
     """Get user by ID."""
-    result = await db.execute(select(User).where(User.id == user_id))
-    return result.scalar_one_or_none()
+    return await db.get(User, user_id)
+
+
+async def get_cached_user(db: AsyncSession, user_id: int) -> Optional[CachedUser]:
+    """Get user by ID, served from the TTL cache when fresh."""
+    now = time.monotonic()
+    entry = _user_cache.get(user_id)
+    if entry and entry[0] > now:
+        return entry[1]
+    user = await get_user_by_id(db, user_id)
+    if not user:
+        _user_cache.pop(user_id, None)
+        return None
+    cached = CachedUser(id=user.id, username=user.username, api_config=user.api_config)
+    if len(_user_cache) >= USER_CACHE_MAXSIZE and user_id not in _user_cache:
+        _user_cache.pop(next(iter(_user_cache)))
+    _user_cache[user_id] = (now + USER_CACHE_TTL, cached)
+    return cached
+
+
+def invalidate_cached_user(user_id: int) -> None:
+    """Drop a user from the TTL cache after it changes."""
+    _user_cache.pop(user_id, None)
+
+
+async def rehash_password(user_id: int, password: str) -> None:
+    """Replace a user's stored hash with one using the current policy."""
+    password_hash = await hash_password(password)
+    async with async_session() as db:
+        user = await db.get(User, user_id)
+        if user:
+            user.password_hash = password_hash
+            await db.commit()
 
 
 async def create_user(db: AsyncSession, username: str, password: str) -> User:
     """Create a new user."""
-    password_hash = hash_password(password)
+    password_hash = await hash_password(password)
     user = User(username=username, password_hash=password_hash)
     db.add(user)
     await db.commit()
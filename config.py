@@ -4,3 +4,17 @@ import os
 
 # 로그인 필요 여부 (환경변수 AUTH_REQUIRED=false로 비활성화)
 AUTH_REQUIRED = os.getenv("AUTH_REQUIRED", "true").lower() == "true"
+
+# 세션 저장소 (REDIS_URL 미설정 시 프로세스 메모리에 저장)
+REDIS_URL = os.getenv("REDIS_URL")
+
+# DB 커넥션 풀 크기
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "10"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "20"))
+
+# SQLite 페이지 캐시 크기 (커넥션마다 할당, 최대 DB_POOL_SIZE + DB_MAX_OVERFLOW배)
+SQLITE_CACHE_SIZE = int(os.getenv("SQLITE_CACHE_SIZE", "16384"))  # KiB
+
+# 비밀번호 해시(Argon2id) 비용 (테스트/개발 환경에서는 낮춰서 사용)
+ARGON2_TIME_COST = int(os.getenv("ARGON2_TIME_COST", "3"))
+ARGON2_MEMORY_COST = int(os.getenv("ARGON2_MEMORY_COST", "65536"))  # KiB
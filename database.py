@@ -1,22 +1,72 @@
 """Database configuration for Agent Hub."""
 
+import os
+
+from sqlalchemy import event, make_url
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
 from sqlalchemy.orm import DeclarativeBase
 
-DATABASE_URL = "sqlite+aiosqlite:///./agent_hub.db"
+from config import DB_MAX_OVERFLOW, DB_POOL_SIZE, REDIS_URL, SQLITE_CACHE_SIZE
+
+DATABASE_URL = os.getenv("DATABASE_URL", "sqlite+aiosqlite:///./agent_hub.db")
+
+# In-memory SQLite gets a StaticPool, which takes no sizing arguments
+_url = make_url(DATABASE_URL)
+_memory_sqlite = _url.get_backend_name() == "sqlite" and (
+    _url.database in (None, "", ":memory:") or _url.query.get("mode") == "memory"
+)
+pool_kwargs = {} if _memory_sqlite else {"pool_size": DB_POOL_SIZE, "max_overflow": DB_MAX_OVERFLOW}
+
+# Keep warm connections around instead of opening one per request
+engine = create_async_engine(
+    DATABASE_URL,
+    echo=False,
+    pool_pre_ping=True,
+    pool_recycle=1800,
+    **pool_kwargs,
+)
+
+if DATABASE_URL.startswith("sqlite"):
+
+    @event.listens_for(engine.sync_engine, "connect")
+    def _set_sqlite_pragmas(dbapi_connection, connection_record):
+        """Tune each new SQLite connection for concurrent reads."""
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")  # readers don't block on the writer
+        cursor.execute("PRAGMA synchronous=NORMAL")  # safe with WAL, fewer fsyncs
+        # Per connection: up to DB_POOL_SIZE + DB_MAX_OVERFLOW caches in total
+        cursor.execute(f"PRAGMA cache_size=-{SQLITE_CACHE_SIZE}")
+        cursor.execute("PRAGMA mmap_size=268435456")  # 256 MiB memory-mapped reads
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.close()
+
 
-engine = create_async_engine(DATABASE_URL, echo=False)
 async_session = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
 
+# Shared session store; without REDIS_URL sessions stay in-process (see auth.py)
+redis_client = None
+if REDIS_URL:
+    from redis.asyncio import from_url as redis_from_url
+
+    redis_client = redis_from_url(REDIS_URL, decode_responses=True)
+
 
 class Base(DeclarativeBase):
     pass
 
 
+def _create_missing_indexes(conn):
+    """Create indexes added after a table was first created."""
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(conn, checkfirst=True)
+
+
 async def init_db():
-    """Initialize database tables."""
+    """Initialize database tables and indexes."""
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
+        await conn.run_sync(_create_missing_indexes)
 
 
 async def get_db():
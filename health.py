@@ -0,0 +1,87 @@
+"""Batched agent health status updates for Agent Hub."""
+
+import asyncio
+import contextlib
+import logging
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import bindparam, update
+
+from database import engine
+from models import Agent
+
+logger = logging.getLogger(__name__)
+
+# Pending updates are written at least this often, or as soon as a batch fills
+HEALTH_FLUSH_INTERVAL = 1.0  # seconds
+HEALTH_FLUSH_BATCH = 100
+
+_queue: Optional[asyncio.Queue[tuple[int, bool, datetime]]] = None
+_batch_ready: Optional[asyncio.Event] = None
+_stopping: Optional[asyncio.Event] = None
+_writer: Optional[asyncio.Task] = None
+
+
+async def write_health_updates(updates: dict[int, tuple[bool, datetime]]) -> None:
+    """Write health status for many agents in a single transaction."""
+    if not updates:
+        return
+    agents = Agent.__table__
+    stmt = (
+        update(agents)
+        .where(agents.c.id == bindparam("agent_id"))
+        .values(is_healthy=bindparam("healthy"), last_health_check=bindparam("checked_at"))
+    )
+    rows = [
+        {"agent_id": agent_id, "healthy": healthy, "checked_at": checked_at}
+        for agent_id, (healthy, checked_at) in updates.items()
+    ]
+    async with engine.begin() as conn:
+        await conn.execute(stmt, rows)
+
+
+def report_health(agent_id: int, healthy: bool, checked_at: datetime) -> None:
+    """Queue an agent health status update for the background writer."""
+    _queue.put_nowait((agent_id, healthy, checked_at))
+    if _queue.qsize() >= HEALTH_FLUSH_BATCH:
+        _batch_ready.set()
+
+
+async def flush_health_updates() -> None:
+    """Write all queued updates, keeping only the latest one per agent."""
+    latest: dict[int, tuple[bool, datetime]] = {}
+    while not _queue.empty():
+        agent_id, healthy, checked_at = _queue.get_nowait()
+        latest[agent_id] = (healthy, checked_at)
+    await write_health_updates(latest)
+
+
+async def _write_periodically() -> None:
+    """Flush queued updates every interval or when a batch is ready."""
+    # Stopped via _stopping rather than cancel() so a flush is never interrupted
+    while not _stopping.is_set():
+        with contextlib.suppress(asyncio.TimeoutError):
+            await asyncio.wait_for(_batch_ready.wait(), HEALTH_FLUSH_INTERVAL)
+        _batch_ready.clear()
+        try:
+            await flush_health_updates()
+        except Exception:
+            logger.exception("Failed to write agent health updates")
+
+
+def start_health_writer() -> None:
+    """Start the background task that writes queued health updates."""
+    global _queue, _batch_ready, _stopping, _writer
+    _queue = asyncio.Queue()
+    _batch_ready = asyncio.Event()
+    _stopping = asyncio.Event()
+    _writer = asyncio.create_task(_write_periodically())
+
+
+async def stop_health_writer() -> None:
+    """Stop the background writer and write whatever is still queued."""
+    _stopping.set()
+    _batch_ready.set()  # wake the writer for its last pass
+    await _writer
+    await flush_health_updates()
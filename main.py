@@ -1,39 +1,82 @@
 """Agent Hub - A2A Agent Registration and Discovery Platform."""
 
-import json
+import asyncio
+import contextlib
+import os
+import secrets
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import asynccontextmanager
-from datetime import datetime
+from types import MappingProxyType
 from typing import Optional
 
 import httpx
-from fastapi import FastAPI, Depends, HTTPException, Request, Response, Form
+import orjson
+from fastapi import FastAPI, BackgroundTasks, Depends, HTTPException, Request, Response, Form
 from fastapi.responses import HTMLResponse, RedirectResponse, JSONResponse, StreamingResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
-from pydantic import BaseModel
-from sqlalchemy import select
+from pydantic import BaseModel, TypeAdapter
+from sqlalchemy import func, select
+from sqlalchemy.orm import defer
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from config import AUTH_REQUIRED
-from database import init_db, get_db
-from models import User, Agent
+from database import init_db, get_db, redis_client
+from health import report_health, start_health_writer, stop_health_writer
+from models import User, Agent, utcnow
 from auth import (
     SESSION_COOKIE_NAME,
+    CachedUser,
     verify_password,
+    needs_rehash,
+    rehash_password,
     create_session,
     get_user_id_from_session,
     delete_session,
     get_user_by_username,
     get_user_by_id,
+    get_cached_user,
+    invalidate_cached_user,
     create_user,
 )
 
 
+# Health timestamps only need second resolution, so read a cached clock
+_now = utcnow()
+
+
+async def _tick_clock():
+    """Refresh the cached timestamp once a second."""
+    global _now
+    while True:
+        _now = utcnow()
+        await asyncio.sleep(1)
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    """Initialize database on startup."""
+    """Initialize database and worker threads on startup."""
+    # Password hashing runs in the default executor (see auth.hash_password)
+    asyncio.get_running_loop().set_default_executor(
+        ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4))
+    )
     await init_db()
+    # One pooled client for all outbound agent calls (keep-alive, HTTP/2)
+    app.state.http = httpx.AsyncClient(
+        timeout=httpx.Timeout(30.0),
+        limits=httpx.Limits(max_connections=200, max_keepalive_connections=50),
+        http2=True,
+    )
+    clock = asyncio.create_task(_tick_clock())
+    start_health_writer()
     yield
+    await stop_health_writer()
+    clock.cancel()
+    with contextlib.suppress(asyncio.CancelledError):
+        await clock
+    await app.state.http.aclose()
+    if redis_client is not None:
+        await redis_client.aclose()
 
 
 app = FastAPI(title="Agent Hub", lifespan=lifespan)
@@ -81,45 +124,71 @@ class AgentResponse(BaseModel):
     is_healthy: bool
 
 
+AGENT_LIST_ADAPTER = TypeAdapter(list[AgentResponse])
+
+# The agent list only needs a preview; GET /api/agents/{id} has the full text
+DESCRIPTION_PREVIEW_LENGTH = 200
+
+
+def _agent_response(agent: Agent, username: Optional[str], description: Optional[str]) -> AgentResponse:
+    """Map an Agent row to its API response without re-validating it."""
+    return AgentResponse.model_construct(
+        id=agent.id,
+        url=agent.url,
+        name=agent.name,
+        description=description,
+        version=agent.version,
+        skills=agent.skills if agent.skills else [],
+        provider=agent.provider,
+        documentation_url=agent.documentation_url,
+        registered_by=username or "Unknown",
+        registered_at=agent.registered_at.isoformat(),
+        is_healthy=agent.is_healthy,
+    )
+
+
 # --- Dependencies ---
 
 
+def get_http_client(request: Request) -> httpx.AsyncClient:
+    """Get the shared outbound HTTP client."""
+    return request.app.state.http
+
+
 # 인증 비활성화 시 사용할 더미 유저
-class AnonymousUser:
-    id = 0
-    username = "anonymous"
+ANONYMOUS_USER = CachedUser(id=0, username="anonymous", api_config=None)
 
 
-async def get_current_user(request: Request, db: AsyncSession = Depends(get_db)) -> User:
+async def get_current_user(request: Request, db: AsyncSession = Depends(get_db)) -> CachedUser:
     """Get current authenticated user."""
     if not AUTH_REQUIRED:
-        return AnonymousUser()
+        return ANONYMOUS_USER
     session_id = request.cookies.get(SESSION_COOKIE_NAME)
-    user_id = get_user_id_from_session(session_id)
+    user_id = await get_user_id_from_session(session_id)
     if not user_id:
         raise HTTPException(status_code=401, detail="Not authenticated")
-    user = await get_user_by_id(db, user_id)
+    user = await get_cached_user(db, user_id)
     if not user:
         raise HTTPException(status_code=401, detail="User not found")
     return user
 
 
-async def get_optional_user(request: Request, db: AsyncSession = Depends(get_db)) -> Optional[User]:
+async def get_optional_user(request: Request, db: AsyncSession = Depends(get_db)) -> Optional[CachedUser]:
     """Get current user if authenticated, None otherwise."""
     if not AUTH_REQUIRED:
-        return AnonymousUser()
+        return ANONYMOUS_USER
     session_id = request.cookies.get(SESSION_COOKIE_NAME)
-    user_id = get_user_id_from_session(session_id)
+    user_id = await get_user_id_from_session(session_id)
     if not user_id:
         return None
-    return await get_user_by_id(db, user_id)
+    return await get_cached_user(db, user_id)
 
 
 # --- Page Routes ---
 
 
 @app.get("/", response_class=HTMLResponse)
-async def index(request: Request, user: Optional[User] = Depends(get_optional_user)):
+async def index(request: Request, user: Optional[CachedUser] = Depends(get_optional_user)):
     """Main page - agent list."""
     if not user:
         return RedirectResponse(url="/login", status_code=302)
@@ -127,7 +196,7 @@ async def index(request: Request, user: Optional[User] = Depends(get_optional_us
 
 
 @app.get("/login", response_class=HTMLResponse)
-async def login_page(request: Request, user: Optional[User] = Depends(get_optional_user)):
+async def login_page(request: Request, user: Optional[CachedUser] = Depends(get_optional_user)):
     """Login page."""
     if user:
         return RedirectResponse(url="/", status_code=302)
@@ -135,7 +204,7 @@ async def login_page(request: Request, user: Optional[User] = Depends(get_option
 
 
 @app.get("/register", response_class=HTMLResponse)
-async def register_page(request: Request, user: Optional[User] = Depends(get_optional_user)):
+async def register_page(request: Request, user: Optional[CachedUser] = Depends(get_optional_user)):
     """Register page."""
     if user:
         return RedirectResponse(url="/", status_code=302)
@@ -143,7 +212,7 @@ async def register_page(request: Request, user: Optional[User] = Depends(get_opt
 
 
 @app.get("/playground", response_class=HTMLResponse)
-async def playground_page(request: Request, user: Optional[User] = Depends(get_optional_user)):
+async def playground_page(request: Request, user: Optional[CachedUser] = Depends(get_optional_user)):
     """Agent Playground - Postman-like testing interface."""
     if not user:
         return RedirectResponse(url="/login", status_code=302)
@@ -151,7 +220,7 @@ async def playground_page(request: Request, user: Optional[User] = Depends(get_o
 
 
 @app.get("/profile", response_class=HTMLResponse)
-async def profile_page(request: Request, user: Optional[User] = Depends(get_optional_user)):
+async def profile_page(request: Request, user: Optional[CachedUser] = Depends(get_optional_user)):
     """User profile - API settings and custom headers."""
     if not user:
         return RedirectResponse(url="/login", status_code=302)
@@ -165,19 +234,23 @@ async def profile_page(request: Request, user: Optional[User] = Depends(get_opti
 async def login(
     request: Request,
     response: Response,
+    background_tasks: BackgroundTasks,
     username: str = Form(...),
     password: str = Form(...),
     db: AsyncSession = Depends(get_db),
 ):
     """Login endpoint."""
     user = await get_user_by_username(db, username)
-    if not user or not verify_password(password, user.password_hash):
+    if not user or not await verify_password(password, user.password_hash):
         return templates.TemplateResponse(
             "login.html",
             {"request": request, "error": "Invalid username or password"},
             status_code=400,
         )
-    session_id = create_session(user.id)
+    # Upgrade bcrypt or outdated Argon2 hashes after the response is sent
+    if needs_rehash(user.password_hash):
+        background_tasks.add_task(rehash_password, user.id, password)
+    session_id = await create_session(user.id)
     response = RedirectResponse(url="/", status_code=302)
     response.set_cookie(
         key=SESSION_COOKIE_NAME,
@@ -219,7 +292,7 @@ async def register(
         )
 
     user = await create_user(db, username, password)
-    session_id = create_session(user.id)
+    session_id = await create_session(user.id)
     response = RedirectResponse(url="/", status_code=302)
     response.set_cookie(
         key=SESSION_COOKIE_NAME,
@@ -236,7 +309,10 @@ async def logout(request: Request):
     """Logout endpoint."""
     session_id = request.cookies.get(SESSION_COOKIE_NAME)
     if session_id:
-        delete_session(session_id)
+        user_id = await get_user_id_from_session(session_id)
+        await delete_session(session_id)
+        if user_id:
+            invalidate_cached_user(user_id)
     response = RedirectResponse(url="/login", status_code=302)
     response.delete_cookie(SESSION_COOKIE_NAME)
     return response
@@ -259,7 +335,7 @@ class ApiConfigRequest(BaseModel):
 @app.get("/api/settings")
 async def get_settings(
     db: AsyncSession = Depends(get_db),
-    user: User = Depends(get_current_user),
+    user: CachedUser = Depends(get_current_user),
 ):
     """Get user's saved API config."""
     return user.api_config or {}
@@ -269,56 +345,124 @@ async def get_settings(
 async def save_settings(
     config: ApiConfigRequest,
     db: AsyncSession = Depends(get_db),
-    user: User = Depends(get_current_user),
+    user: CachedUser = Depends(get_current_user),
 ):
     """Save user's API config."""
     # Filter out None values
     api_config = {k: v for k, v in config.model_dump().items() if v}
-    user.api_config = api_config
+    # The current user is a cached snapshot; load the row to update it
+    db_user = await get_user_by_id(db, user.id)
+    if not db_user:
+        raise HTTPException(status_code=401, detail="User not found")
+    db_user.api_config = api_config
     await db.commit()
+    invalidate_cached_user(user.id)
     return {"status": "ok", "saved": list(api_config.keys())}
 
 
+# --- A2A Requests ---
+
+
+_BASE_HEADERS = MappingProxyType({"Content-Type": "application/json"})
+
+# AgentTestRequest field -> header forwarded to the agent
+_API_KEY_HEADERS = (
+    ("openai_api_key", "X-OpenAI-API-Key"),
+    ("openai_base_url", "X-OpenAI-Base-URL"),
+    ("openai_model", "X-OpenAI-Model"),
+    ("tavily_api_key", "X-Tavily-API-Key"),
+)
+
+
+def _build_headers(req: AgentTestRequest, accept: Optional[str] = None) -> dict[str, str]:
+    """Build agent request headers with the user's API keys and custom headers."""
+    headers = dict(_BASE_HEADERS)
+    if accept:
+        headers["Accept"] = accept
+    for attr, name in _API_KEY_HEADERS:
+        value = getattr(req, attr)
+        if value:
+            headers[name] = value
+    # Add custom headers with X- prefix
+    if req.custom_headers:
+        for key, value in req.custom_headers.items():
+            header_key = key if key.lower().startswith("x-") else f"X-{key}"
+            headers[header_key] = value
+    return headers
+
+
+# Pre-serialized JSON-RPC request bodies; only the message id and text vary
+_SEND_TEMPLATE = (
+    b'{"jsonrpc":"2.0","id":"test-1","method":"message/send",'
+    b'"params":{"message":{"messageId":%b,"role":"user","parts":[{"type":"text","text":%b}]}}}'
+)
+_STREAM_TEMPLATE = (
+    b'{"jsonrpc":"2.0","id":"stream-1","method":"message/stream",'
+    b'"params":{"message":{"messageId":%b,"role":"user","parts":[{"type":"text","text":%b}]}}}'
+)
+
+
+def _a2a_message(template: bytes, text: str) -> bytes:
+    """Render a JSON-RPC A2A request body carrying a single user text message."""
+    return template % (orjson.dumps(secrets.token_hex(16)), orjson.dumps(text))
+
+
 # --- Agent API ---
 
 
-@app.get("/api/agents")
+@app.get("/api/agents", response_model=list[AgentResponse])
 async def list_agents(
     db: AsyncSession = Depends(get_db),
-    user: User = Depends(get_current_user),
-) -> list[AgentResponse]:
+    user: CachedUser = Depends(get_current_user),
+) -> Response:
     """List all registered agents."""
-    result = await db.execute(select(Agent).order_by(Agent.registered_at.desc()))
-    agents = result.scalars().all()
-
-    # Get usernames for all agents
-    user_ids = {a.user_id for a in agents}
-    users_result = await db.execute(select(User).where(User.id.in_(user_ids)))
-    users_map = {u.id: u.username for u in users_result.scalars().all()}
-
-    return [
-        AgentResponse(
-            id=a.id,
-            url=a.url,
-            name=a.name,
-            description=a.description,
-            version=a.version,
-            skills=a.skills if a.skills else [],
-            provider=a.provider,
-            documentation_url=a.documentation_url,
-            registered_by=users_map.get(a.user_id, "Unknown"),
-            registered_at=a.registered_at.isoformat(),
-            is_healthy=a.is_healthy,
+    # Outer join: agents registered with auth disabled have no owning user row
+    result = await db.execute(
+        select(
+            Agent,
+            User.username,
+            func.substr(Agent.description, 1, DESCRIPTION_PREVIEW_LENGTH),
         )
-        for a in agents
+        .options(defer(Agent.description))
+        .outerjoin(User, Agent.user_id == User.id)
+        .order_by(Agent.registered_at.desc())
+    )
+
+    # Rows come from our own DB: skip per-item validation and serialize the
+    # whole list in one pass instead of re-validating it as a response model
+    agents = [
+        _agent_response(agent, username, description)
+        for agent, username, description in result.all()
     ]
+    return Response(content=AGENT_LIST_ADAPTER.dump_json(agents), media_type="application/json")
+
+
+@app.get("/api/agents/{agent_id}")
+async def get_agent(
+    agent_id: int,
+    db: AsyncSession = Depends(get_db),
+    user: CachedUser = Depends(get_current_user),
+) -> AgentResponse:
+    """Get a single agent, including its full description."""
+    result = await db.execute(
+        select(Agent, User.username)
+        .outerjoin(User, Agent.user_id == User.id)
+        .where(Agent.id == agent_id)
+    )
+    row = result.one_or_none()
+    if not row:
+        raise HTTPException(status_code=404, detail="Agent not found")
+    agent, username = row
+
+    return _agent_response(agent, username, agent.description)
 
 
 @app.post("/api/agents")
 async def register_agent(
     req: AgentRegisterRequest,
     db: AsyncSession = Depends(get_db),
-    user: User = Depends(get_current_user),
+    user: CachedUser = Depends(get_current_user),
+    client: httpx.AsyncClient = Depends(get_http_client),
 ) -> AgentResponse:
     """Register a new agent by URL."""
     url = req.url.rstrip("/")
@@ -331,10 +475,9 @@ async def register_agent(
     # Fetch AgentCard from /.well-known/agent.json
     agent_card_url = f"{url}/.well-known/agent.json"
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            resp = await client.get(agent_card_url)
-            resp.raise_for_status()
-            card = resp.json()
+        resp = await client.get(agent_card_url, timeout=10.0)
+        resp.raise_for_status()
+        card = orjson.loads(resp.content)
     except httpx.HTTPError as e:
         raise HTTPException(
             status_code=400,
@@ -347,14 +490,19 @@ async def register_agent(
         )
 
     # Extract skills as list of skill info
-    skills = []
-    if "skills" in card:
-        for skill in card.get("skills", []):
-            skills.append({
-                "id": skill.get("id"),
-                "name": skill.get("name"),
-                "description": skill.get("description"),
-            })
+    skills = [
+        {
+            "id": skill.get("id"),
+            "name": skill.get("name"),
+            "description": skill.get("description"),
+        }
+        for skill in card.get("skills") or ()
+    ]
+
+    # provider is either {"organization": ...} or a plain string
+    provider = card.get("provider")
+    if isinstance(provider, dict):
+        provider = provider.get("organization")
 
     # Create agent record
     agent = Agent(
@@ -363,40 +511,27 @@ async def register_agent(
         description=card.get("description"),
         version=card.get("version"),
         skills=skills,
-        provider=card.get("provider", {}).get("organization") if isinstance(card.get("provider"), dict) else card.get("provider"),
+        provider=provider,
         documentation_url=card.get("documentationUrl"),
         user_id=user.id,
         is_healthy=True,
-        last_health_check=datetime.utcnow(),
+        last_health_check=_now,
     )
     db.add(agent)
     await db.commit()
     await db.refresh(agent)
 
-    return AgentResponse(
-        id=agent.id,
-        url=agent.url,
-        name=agent.name,
-        description=agent.description,
-        version=agent.version,
-        skills=agent.skills if agent.skills else [],
-        provider=agent.provider,
-        documentation_url=agent.documentation_url,
-        registered_by=user.username,
-        registered_at=agent.registered_at.isoformat(),
-        is_healthy=agent.is_healthy,
-    )
+    return _agent_response(agent, user.username, agent.description)
 
 
 @app.delete("/api/agents/{agent_id}")
 async def delete_agent(
     agent_id: int,
     db: AsyncSession = Depends(get_db),
-    user: User = Depends(get_current_user),
+    user: CachedUser = Depends(get_current_user),
 ):
     """Delete an agent (owner only)."""
-    result = await db.execute(select(Agent).where(Agent.id == agent_id))
-    agent = result.scalar_one_or_none()
+    agent = await db.get(Agent, agent_id)
     if not agent:
         raise HTTPException(status_code=404, detail="Agent not found")
     if agent.user_id != user.id:
@@ -412,68 +547,35 @@ async def test_agent(
     agent_id: int,
     req: AgentTestRequest,
     db: AsyncSession = Depends(get_db),
-    user: User = Depends(get_current_user),
+    user: CachedUser = Depends(get_current_user),
+    client: httpx.AsyncClient = Depends(get_http_client),
 ):
     """Test an agent by sending a message."""
-    result = await db.execute(select(Agent).where(Agent.id == agent_id))
-    agent = result.scalar_one_or_none()
+    agent = await db.get(Agent, agent_id)
     if not agent:
         raise HTTPException(status_code=404, detail="Agent not found")
 
     # Send A2A message to agent
     try:
-        import uuid
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            # Build headers with optional API keys
-            headers = {"Content-Type": "application/json"}
-            if req.openai_api_key:
-                headers["X-OpenAI-API-Key"] = req.openai_api_key
-            if req.openai_base_url:
-                headers["X-OpenAI-Base-URL"] = req.openai_base_url
-            if req.openai_model:
-                headers["X-OpenAI-Model"] = req.openai_model
-            if req.tavily_api_key:
-                headers["X-Tavily-API-Key"] = req.tavily_api_key
-            # Add custom headers with X- prefix
-            if req.custom_headers:
-                for key, value in req.custom_headers.items():
-                    header_key = key if key.lower().startswith("x-") else f"X-{key}"
-                    headers[header_key] = value
-
-            # A2A protocol: POST to agent URL with JSON-RPC style message
-            message_id = str(uuid.uuid4())
-            payload = {
-                "jsonrpc": "2.0",
-                "id": "test-1",
-                "method": "message/send",
-                "params": {
-                    "message": {
-                        "messageId": message_id,
-                        "role": "user",
-                        "parts": [{"type": "text", "text": req.message}],
-                    }
-                },
-            }
-            resp = await client.post(agent.url, json=payload, headers=headers)
-            resp.raise_for_status()
-            response_data = resp.json()
-
-            # Update health status
-            agent.is_healthy = True
-            agent.last_health_check = datetime.utcnow()
-            await db.commit()
-
-            return {"status": "success", "response": response_data}
+        # Build headers with optional API keys
+        headers = _build_headers(req)
+
+        # A2A protocol: POST to agent URL with JSON-RPC style message
+        payload = _a2a_message(_SEND_TEMPLATE, req.message)
+        resp = await client.post(agent.url, content=payload, headers=headers, timeout=30.0)
+        resp.raise_for_status()
+        response_data = orjson.loads(resp.content)
+
+        # Update health status
+        report_health(agent.id, True, _now)
+
+        return {"status": "success", "response": response_data}
     except httpx.HTTPError as e:
         # Update health status on failure
-        agent.is_healthy = False
-        agent.last_health_check = datetime.utcnow()
-        await db.commit()
+        report_health(agent.id, False, _now)
         raise HTTPException(status_code=502, detail=f"Agent communication failed: {str(e)}")
     except Exception as e:
-        agent.is_healthy = False
-        agent.last_health_check = datetime.utcnow()
-        await db.commit()
+        report_health(agent.id, False, _now)
         raise HTTPException(status_code=500, detail=f"Unexpected error: {str(e)}")
 
 
@@ -482,63 +584,34 @@ async def stream_agent(
     agent_id: int,
     req: AgentTestRequest,
     db: AsyncSession = Depends(get_db),
-    user: User = Depends(get_current_user),
+    user: CachedUser = Depends(get_current_user),
+    client: httpx.AsyncClient = Depends(get_http_client),
 ):
     """Stream agent response with real-time status updates."""
-    result = await db.execute(select(Agent).where(Agent.id == agent_id))
-    agent = result.scalar_one_or_none()
+    agent = await db.get(Agent, agent_id)
     if not agent:
         raise HTTPException(status_code=404, detail="Agent not found")
 
-    import uuid
-
     # Build headers
-    headers = {"Content-Type": "application/json", "Accept": "text/event-stream"}
-    if req.openai_api_key:
-        headers["X-OpenAI-API-Key"] = req.openai_api_key
-    if req.openai_base_url:
-        headers["X-OpenAI-Base-URL"] = req.openai_base_url
-    if req.openai_model:
-        headers["X-OpenAI-Model"] = req.openai_model
-    if req.tavily_api_key:
-        headers["X-Tavily-API-Key"] = req.tavily_api_key
-    if req.custom_headers:
-        for key, value in req.custom_headers.items():
-            header_key = key if key.lower().startswith("x-") else f"X-{key}"
-            headers[header_key] = value
+    headers = _build_headers(req, accept="text/event-stream")
 
-    message_id = str(uuid.uuid4())
-    payload = {
-        "jsonrpc": "2.0",
-        "id": "stream-1",
-        "method": "message/stream",
-        "params": {
-            "message": {
-                "messageId": message_id,
-                "role": "user",
-                "parts": [{"type": "text", "text": req.message}],
-            }
-        },
-    }
+    payload = _a2a_message(_STREAM_TEMPLATE, req.message)
 
     async def event_generator():
         try:
-            async with httpx.AsyncClient(timeout=120.0) as client:
-                async with client.stream("POST", agent.url, json=payload, headers=headers) as resp:
-                    if resp.status_code != 200:
-                        error_text = await resp.aread()
-                        yield f"data: {json.dumps({'error': error_text.decode(), 'status_code': resp.status_code})}\n\n"
-                        return
-
-                    async for line in resp.aiter_lines():
-                        if line:
-                            yield f"{line}\n"
-                        else:
-                            yield "\n"
+            async with client.stream("POST", agent.url, content=payload, headers=headers, timeout=120.0) as resp:
+                if resp.status_code != 200:
+                    error_text = await resp.aread()
+                    yield f"data: {orjson.dumps({'error': error_text.decode(), 'status_code': resp.status_code}).decode()}\n\n"
+                    return
+
+                # Forward chunks as they arrive; the browser parses the SSE framing
+                async for chunk in resp.aiter_bytes():
+                    yield chunk
         except httpx.HTTPError as e:
-            yield f"data: {json.dumps({'error': str(e), 'type': 'connection_error'})}\n\n"
+            yield f"data: {orjson.dumps({'error': str(e), 'type': 'connection_error'}).decode()}\n\n"
         except Exception as e:
-            yield f"data: {json.dumps({'error': str(e), 'type': 'unexpected_error'})}\n\n"
+            yield f"data: {orjson.dumps({'error': str(e), 'type': 'unexpected_error'}).decode()}\n\n"
 
     return StreamingResponse(
         event_generator(),
@@ -555,30 +628,59 @@ async def stream_agent(
 async def check_agent_health(
     agent_id: int,
     db: AsyncSession = Depends(get_db),
-    user: User = Depends(get_current_user),
+    user: CachedUser = Depends(get_current_user),
+    client: httpx.AsyncClient = Depends(get_http_client),
 ):
     """Check agent health by fetching agent card."""
-    result = await db.execute(select(Agent).where(Agent.id == agent_id))
-    agent = result.scalar_one_or_none()
+    agent = await db.get(Agent, agent_id)
     if not agent:
         raise HTTPException(status_code=404, detail="Agent not found")
 
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            resp = await client.get(f"{agent.url}/.well-known/agent.json")
-            resp.raise_for_status()
-
-            agent.is_healthy = True
-            agent.last_health_check = datetime.utcnow()
-            await db.commit()
-            return {"status": "healthy", "url": agent.url}
+        resp = await client.get(f"{agent.url}/.well-known/agent.json", timeout=10.0)
+        resp.raise_for_status()
+
+        report_health(agent.id, True, _now)
+        return {"status": "healthy", "url": agent.url}
     except Exception:
-        agent.is_healthy = False
-        agent.last_health_check = datetime.utcnow()
-        await db.commit()
+        report_health(agent.id, False, _now)
         return {"status": "unhealthy", "url": agent.url}
 
 
+# Upper bound on agent card fetches in flight during a bulk refresh
+HEALTH_REFRESH_CONCURRENCY = 50
+
+
+@app.post("/api/agents/health-refresh")
+async def refresh_agent_health(
+    db: AsyncSession = Depends(get_db),
+    user: CachedUser = Depends(get_current_user),
+    client: httpx.AsyncClient = Depends(get_http_client),
+):
+    """Check health of all agents concurrently."""
+    result = await db.execute(select(Agent.id, Agent.url))
+    agents = result.all()
+    semaphore = asyncio.Semaphore(HEALTH_REFRESH_CONCURRENCY)
+
+    async def check(url: str) -> bool:
+        async with semaphore:
+            try:
+                resp = await client.get(f"{url}/.well-known/agent.json", timeout=10.0)
+                resp.raise_for_status()
+                return True
+            except Exception:
+                return False
+
+    results = await asyncio.gather(*(check(url) for _, url in agents))
+    for (agent_id, _), healthy in zip(agents, results):
+        report_health(agent_id, healthy, _now)
+
+    return [
+        {"id": agent_id, "url": url, "status": "healthy" if healthy else "unhealthy"}
+        for (agent_id, url), healthy in zip(agents, results)
+    ]
+
+
 def run():
     """Entry point for agent-hub CLI."""
     import uvicorn
@@ -1,13 +1,18 @@
 """SQLAlchemy models for Agent Hub."""
 
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Optional
-from sqlalchemy import String, Text, Boolean, DateTime, ForeignKey, JSON
+from sqlalchemy import String, Text, Boolean, DateTime, ForeignKey, JSON, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from database import Base
 
 
+def utcnow() -> datetime:
+    """Current UTC time as a naive datetime (replaces deprecated datetime.utcnow)."""
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
 class User(Base):
     """User model for authentication."""
 
@@ -16,7 +21,7 @@ class User(Base):
     id: Mapped[int] = mapped_column(primary_key=True)
     username: Mapped[str] = mapped_column(String(50), unique=True, nullable=False)
     password_hash: Mapped[str] = mapped_column(String(255), nullable=False)
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=utcnow)
     api_config: Mapped[Optional[dict]] = mapped_column(JSON, default=dict)
 
     agents: Mapped[list["Agent"]] = relationship(back_populates="user", cascade="all, delete-orphan")
@@ -36,9 +41,14 @@ class Agent(Base):
     provider: Mapped[Optional[str]] = mapped_column(String(200))
     documentation_url: Mapped[Optional[str]] = mapped_column(String(500))
 
-    user_id: Mapped[int] = mapped_column(ForeignKey("users.id"), nullable=False)
+    user_id: Mapped[int] = mapped_column(ForeignKey("users.id"), nullable=False, index=True)
     user: Mapped["User"] = relationship(back_populates="agents")
 
-    registered_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    registered_at: Mapped[datetime] = mapped_column(DateTime, default=utcnow)
     last_health_check: Mapped[Optional[datetime]] = mapped_column(DateTime)
     is_healthy: Mapped[bool] = mapped_column(Boolean, default=True)
+
+    __table_args__ = (
+        # Backs the newest-first ordering of the agent list
+        Index("ix_agents_registered_at", registered_at.desc()),
+    )